@@ -6,6 +6,9 @@ class Attacker(AttackerBase):
     def __init__(self):
         AttackerBase.__init__(self, 'attacker')
 
+        self.__attack_names = list(self.attack_list.keys())
+        self.__menu = self.__create_menu()
+
     def __get_menu_line(self, template, number, text):
         return template.format(
             self._make_text(str(number)+')', self.COLOR_BLUE),
@@ -14,17 +17,15 @@ class Attacker(AttackerBase):
         )
 
     def __create_menu(self):
-        menu = "\n" + self.__get_menu_line('{} to {} press {} \n', 0, 'clear')
-        i = 0
-        for attack in self.attack_list.keys():
-            i += 1
-            menu += self.__get_menu_line('{} To apply the {} attack press {} \n', i, attack)
+        lines = ["\n", self.__get_menu_line('{} to {} press {} \n', 0, 'clear')]
+        for i, attack in enumerate(self.__attack_names, start=1):
+            lines.append(self.__get_menu_line('{} To apply the {} attack press {} \n', i, attack))
 
-        return menu
+        return ''.join(lines)
 
     def _logic(self):
-        self.report(self.__create_menu())
-        attack_cnt = len(self.attack_list)
+        self.report(self.__menu)
+        attack_cnt = len(self.__attack_names)
 
         try:
             attack_name = int(input('your choice (1 to {}): '.format(attack_cnt)))
@@ -34,7 +35,7 @@ class Attacker(AttackerBase):
                 return
 
             if 0 < attack_name <= attack_cnt:
-                attack_name = list(self.attack_list.keys())[attack_name-1]
+                attack_name = self.__attack_names[attack_name-1]
 
             self._apply_attack(attack_name)
 
@@ -7,8 +7,6 @@ from scapy.config import conf
 from scapy.layers.l2 import Ether
 from datetime import datetime, timedelta
 from ics_sim.Device import Runnable
-import logging
-import subprocess
 
 from ics_sim.Attacks import _do_scan_scapy_attack, _do_replay_scapy_attack, _do_mitm_scapy_attack, \
     _do_scan_nmap_attack, _do_command_injection_attack, _do_ddos_attack
@@ -27,13 +25,12 @@ class AttackerBase(Runnable, ABC):
         super().__init__(name1, 100)
 
         self.log_path = os.path.join('.', 'logs', 'attack-logs')
-        if not os.path.exists(self.log_path):
-            os.makedirs(self.log_path)
+        os.makedirs(self.log_path, exist_ok=True)
 
         self.MAC = Ether().src
         self.IP = get_if_addr(conf.iface)
 
-        self.attack_history = self.get_history_logger()
+        self.attack_history = self.get_history_file()
 
         self.attack_list = {
             # 'scan-ettercap': 'ip-scan',
@@ -46,42 +43,31 @@ class AttackerBase(Runnable, ABC):
             AttackerBase.NAME_ATTACK_REPLY_SCAPY: 'replay',
             AttackerBase.NAME_ATTACK_COMMAND_INJECTION: 'command-injection'}
 
-    def get_history_logger(self):
-        attack_history = self.setup_logger(
-            f'{self.name()}_summary',
-            logging.Formatter('%(message)s'),
-            file_dir=self.log_path,
-            file_ext='.csv'
-        )
-
-        attack_history.info(
-            "{},{},{},{},{},{},{},{}"
-            .format("attack", "startStamp", "endStamp", "startTime", "endTime", "attackerMAC", "attackerIP",
-                    "description")
+        self.__attack_handlers = {
+            AttackerBase.NAME_ATTACK_SCAN_SCAPY: self._scan_scapy_attack,
+            AttackerBase.NAME_ATTACK_REPLY_SCAPY: self._replay_scapy_attack,
+            AttackerBase.NAME_ATTACK_MITM_SCAPY: self._mitm_scapy_attack,
+            AttackerBase.NAME_ATTACK_SCAN_MMAP: self._scan_nmap_attack,
+            AttackerBase.NAME_ATTACK_COMMAND_INJECTION: self._command_injection_attack,
+            AttackerBase.NAME_ATTACK_DDOS: self._ddos_attack}
+
+    def get_history_file(self):
+        # rows are already formatted CSV, so write them straight to a line-buffered file instead of a logger
+        attack_history = open(os.path.join(self.log_path, f'{self.name()}_summary.csv'), 'w', buffering=1)
+
+        attack_history.write(
+            ','.join(("attack", "startStamp", "endStamp", "startTime", "endTime", "attackerMAC", "attackerIP",
+                      "description")) + '\n'
         )
 
         return attack_history
 
     def _apply_attack(self, name):
-        if name == AttackerBase.NAME_ATTACK_SCAN_SCAPY:
-            self._scan_scapy_attack()
-
-        elif name == AttackerBase.NAME_ATTACK_REPLY_SCAPY:
-            self._replay_scapy_attack()
-
-        elif name == AttackerBase.NAME_ATTACK_MITM_SCAPY:
-            self._mitm_scapy_attack()
-
-        elif name == AttackerBase.NAME_ATTACK_SCAN_MMAP:
-            self._scan_nmap_attack()
-
-        elif name == AttackerBase.NAME_ATTACK_COMMAND_INJECTION:
-            self._command_injection_attack()
-
-        elif name == AttackerBase.NAME_ATTACK_DDOS:
-            self._ddos_attack()
-        else:
+        handler = self.__attack_handlers.get(name)
+        if handler is None:
             self.report('Attack not found!')
+        else:
+            handler()
 
     def _scan_scapy_attack(self, target='192.168.0.1/24', timeout=10):
         name = AttackerBase.NAME_ATTACK_SCAN_SCAPY
@@ -149,12 +135,9 @@ class AttackerBase(Runnable, ABC):
         self._post_apply_attack(attack_name=name, start_time=start, end_time=end, post_wait_time=5)
 
     def _post_apply_attack(self, attack_name, start_time, end_time, post_wait_time):
-        self.attack_history.info(
-            "{},{},{},{},{},{},{},{}".format(
-                self.attack_list[attack_name]
-                , start_time.timestamp(), end_time.timestamp(), start_time, end_time, self.MAC, self.IP,
-                attack_name
-            )
+        self.attack_history.write(
+            f'{self.attack_list[attack_name]},{start_time.timestamp()},{end_time.timestamp()},'
+            f'{start_time},{end_time},{self.MAC},{self.IP},{attack_name}\n'
         )
         self.report(f'applied {attack_name} attack successfully.')
         self.report(f'waiting {post_wait_time} seconds to cooldown attack.')
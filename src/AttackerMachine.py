@@ -1,9 +1,4 @@
-import logging
-import os
 import random
-import subprocess
-from datetime import datetime, timedelta
-from time import sleep
 
 from AttackerBase import AttackerBase
 
@@ -45,12 +40,10 @@ class AttackerMachine(AttackerBase):
             try:
                 self._apply_attack(attack_name)
 
-                if not self.__status_board.keys().__contains__(attack_name):
-                    self.__status_board[attack_name] = 0
-                self.__status_board[attack_name] += 1
+                self.__status_board[attack_name] = self.__status_board.get(attack_name, 0) + 1
 
-                for attack in self.__status_board.keys():
-                    text = '{}: applied {} times'.format(attack, self.__status_board[attack])
+                for attack, count in self.__status_board.items():
+                    text = '{}: applied {} times'.format(attack, count)
                     self.report(self._make_text(text, self.COLOR_GREEN))
 
             except ValueError as e:
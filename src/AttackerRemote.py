@@ -2,7 +2,6 @@ import json
 import logging
 import os
 import threading
-import time
 import paho.mqtt.client as mqtt
 from AttackerBase import AttackerBase
 from MqttHelper import read_mqtt_params
@@ -13,6 +12,13 @@ from ics_sim.Device import Runnable
 
 class AttackerRemote(AttackerBase):
 
+    DEVICE_ADDRESSES = {
+        'plc1': '192.168.0.11',
+        'plc2': '192.168.0.12',
+        'hmi1': '192.168.0.21',
+        'hmi2': '192.168.0.22',
+    }
+
     def __init__(self):
         AttackerBase.__init__(self, 'attacker_remote')
 
@@ -24,14 +30,26 @@ class AttackerRemote(AttackerBase):
         self.attacksQueue = queue.Queue()
         self.client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION1)
 
+        self.__message_handlers = {
+            'ip-scan': self.__process_ip_scan,
+            'ddos': self.__process_ddos,
+            'port-scan': self.__process_port_scan,
+            'mitm': self.__process_mitm,
+            'replay': self.__process_replay,
+        }
+
     def _logic(self):
 
         if not self.enabled:
             self.__try_enable()
-        elif not self.attacksQueue.empty():
-            self.process_messages(self.attacksQueue.get())
-        else:
-            time.sleep(2)
+            return
+
+        # block on the queue so an incoming attack wakes the loop immediately instead of on the next poll
+        try:
+            msg = self.attacksQueue.get(timeout=2)
+        except queue.Empty:
+            return
+        self.process_messages(msg)
 
     def __try_enable(self):
 
@@ -121,46 +139,46 @@ class AttackerRemote(AttackerBase):
             self.report(f'Start processing incoming message: ({msg})', level=logging.INFO)
             attack = self.find_tag_in_msg(msg, 'attack')
 
-            if attack == 'ip-scan':
-                self._scan_scapy_attack()
-
-            elif attack == 'ddos':
-                timeout = self.find_tag_in_msg(msg, 'timeout')
-                target = self.find_tag_in_msg(msg, 'target')
-                target = self.find_device_address(target)
-                self._ddos_attack(timeout=timeout, target=target, num_process=5)
-
-            elif attack == 'port-scan':
-                self._scan_nmap_attack()
-
-            elif attack == 'mitm':
-                mode = self.find_tag_in_msg(msg, 'mode')
-                timeout = self.find_tag_in_msg(msg, 'timeout')
-                target = '192.168.0.1/24'
-                if mode.lower() == 'link':
-                    target_1 = self.find_tag_in_msg(msg, 'target1')
-                    target_2 = self.find_tag_in_msg(msg, 'target2')
-                    target = self.find_device_address(target_1) + "," + self.find_device_address(target_2)
-                self._mitm_scapy_attack(target=target, timeout=timeout)
-
-            elif attack == 'replay':
-                mode = self.find_tag_in_msg(msg, 'mode')
-                timeout = self.find_tag_in_msg(msg, 'timeout')
-                target = '192.168.0.1/24'
-                replay = self.find_tag_in_msg(msg, 'replay')
-                if mode.lower() == 'link':
-                    target_1 = self.find_tag_in_msg(msg, 'target1')
-                    target_2 = self.find_tag_in_msg(msg, 'target2')
-                    target = self.find_device_address(target_1) + "," + self.find_device_address(target_2)
-                self._replay_scapy_attack(target=target, timeout=timeout, replay_count=replay)
-
-            else:
+            handler = self.__message_handlers.get(attack)
+            if handler is None:
                 raise Exception(f"attack type: ({attack}) is not recognized!")
+            handler(msg)
         except Exception as e:
             self.report(e.__str__())
 
         self.applying_attack = False
 
+    def __process_ip_scan(self, msg):
+        self._scan_scapy_attack()
+
+    def __process_ddos(self, msg):
+        timeout = self.find_tag_in_msg(msg, 'timeout')
+        target = self.find_tag_in_msg(msg, 'target')
+        target = self.find_device_address(target)
+        self._ddos_attack(timeout=timeout, target=target, num_process=5)
+
+    def __process_port_scan(self, msg):
+        self._scan_nmap_attack()
+
+    def __process_mitm(self, msg):
+        mode = self.find_tag_in_msg(msg, 'mode')
+        timeout = self.find_tag_in_msg(msg, 'timeout')
+        target = self.__find_target(msg, mode)
+        self._mitm_scapy_attack(target=target, timeout=timeout)
+
+    def __process_replay(self, msg):
+        mode = self.find_tag_in_msg(msg, 'mode')
+        timeout = self.find_tag_in_msg(msg, 'timeout')
+        replay = self.find_tag_in_msg(msg, 'replay')
+        target = self.__find_target(msg, mode)
+        self._replay_scapy_attack(target=target, timeout=timeout, replay_count=replay)
+
+    def __find_target(self, msg, mode):
+        if mode.lower() == 'link':
+            target_1 = self.find_tag_in_msg(msg, 'target1')
+            target_2 = self.find_tag_in_msg(msg, 'target2')
+            return self.find_device_address(target_1) + "," + self.find_device_address(target_2)
+        return '192.168.0.1/24'
 
     @staticmethod
     def find_tag_in_msg(msg, tag):
@@ -170,18 +188,10 @@ class AttackerRemote(AttackerBase):
 
     @staticmethod
     def find_device_address(device_name):
-        if device_name.lower() == 'plc1':
-            return '192.168.0.11'
-        elif device_name.lower() == 'plc2':
-            return '192.168.0.12'
-
-        elif device_name.lower() == 'hmi1':
-            return '192.168.0.21'
-
-        elif device_name.lower() == 'hmi2':
-            return '192.168.0.22'
-        else:
+        address = AttackerRemote.DEVICE_ADDRESSES.get(device_name.lower())
+        if address is None:
             raise Exception(f'target:({device_name}) is not recognized!')
+        return address
 
 
 if __name__ == '__main__':
@@ -1,8 +1,7 @@
-import logging
-import os
 import random
 import sys
 from datetime import datetime
+import time
 from time import sleep
 
 from ics_sim.Device import HMI
@@ -17,11 +16,13 @@ class CommandInjectionAgent(HMI):
 
     def _before_start(self):
         self._set_clear_scr(False)
-        self.time = datetime.now().timestamp()
+        self.time = time.monotonic()
         self.period = 0
     def _logic(self):
+        # pace the injections on the monotonic clock, wall clock is only needed for the report
+        current = time.monotonic()
 
-        if datetime.now().timestamp() > self.time +  self.period :
+        if current > self.time + self.period:
             value =int( self._receive(self.destination))
             if int(value) == 1:
                 value = 0
@@ -29,10 +30,10 @@ class CommandInjectionAgent(HMI):
                 value = 1
 
             self._send(self.destination, value)
-            self.report( 'on time {} ({}) Signal {} changed to {}'.format( datetime.now(), datetime.now().timestamp(), destinations, value))
+            now = datetime.now()
+            self.report('on time {} ({}) Signal {} changed to {}'.format(now, now.timestamp(), self.destination, value))
             self.period = random.randint(2, 8)
-            self.time = datetime.now().timestamp()
-
+            self.time = current
 
 
 
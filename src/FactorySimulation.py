@@ -12,12 +12,16 @@ class FactorySimulation(HIL):
     def _logic(self):
         elapsed_time = self._current_loop_time - self._last_loop_time
 
+        # each _get is a round trip to the physical-process store, so read the shared tags once per cycle
+        tank_output_valve_status = self._get(TAG.TAG_TANK_OUTPUT_VALVE_STATUS)
+        bottle_distance_to_filler = self._get(TAG.TAG_BOTTLE_DISTANCE_TO_FILLER_VALUE)
+
         # update tank water level
         tank_water_amount = self._get(TAG.TAG_TANK_LEVEL_VALUE) * PHYSICS.TANK_LEVEL_CAPACITY
         if self._get(TAG.TAG_TANK_INPUT_VALVE_STATUS):
             tank_water_amount += PHYSICS.TANK_INPUT_FLOW_RATE * elapsed_time
 
-        if self._get(TAG.TAG_TANK_OUTPUT_VALVE_STATUS):
+        if tank_output_valve_status:
             tank_water_amount -= PHYSICS.TANK_OUTPUT_FLOW_RATE * elapsed_time
 
         tank_water_level = tank_water_amount / PHYSICS.TANK_LEVEL_CAPACITY
@@ -31,11 +35,11 @@ class FactorySimulation(HIL):
 
         # update tank water flow
         tank_water_flow = 0
-        if self._get(TAG.TAG_TANK_OUTPUT_VALVE_STATUS) and tank_water_amount > 0:
+        if tank_output_valve_status and tank_water_amount > 0:
             tank_water_flow = PHYSICS.TANK_OUTPUT_FLOW_RATE
 
         # update bottle water
-        if self._get(TAG.TAG_BOTTLE_DISTANCE_TO_FILLER_VALUE) > 1:
+        if bottle_distance_to_filler > 1:
             bottle_water_amount = 0
             if self._get(TAG.TAG_TANK_OUTPUT_FLOW_VALUE):
                 self.report('water is wasting', logging.WARNING)
@@ -50,7 +54,6 @@ class FactorySimulation(HIL):
             self.report('bottle water overflowed', logging.WARNING)
 
         # update bottle position
-        bottle_distance_to_filler = self._get(TAG.TAG_BOTTLE_DISTANCE_TO_FILLER_VALUE)
         if self._get(TAG.TAG_CONVEYOR_BELT_ENGINE_STATUS):
             bottle_distance_to_filler -= elapsed_time * PHYSICS.CONVEYOR_BELT_SPEED
             bottle_distance_to_filler %= PHYSICS.BOTTLE_DISTANCE
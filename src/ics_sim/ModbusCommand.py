@@ -1,9 +1,11 @@
-from datetime import datetime
+import time
 
 from protocol import ClientModbus
 
 
 class ModbusCommand:
+    __slots__ = ('sip', 'dip', 'port', 'command', 'tag', 'address', 'value', 'time', 'new_value')
+
     clients = dict()
 
     command_write_multiple_registers = 16
@@ -17,7 +19,7 @@ class ModbusCommand:
         self.tag = int(tag)
         self.address = tag * word_num
         self.value = value
-        self.time = datetime.now().timestamp()
+        self.time = time.monotonic()
         self.new_value = new_value
 
     def __str__(self):
@@ -1,38 +1,8 @@
-from scapy.all import *
+import struct
 
+MODBUS_TCP_STRUCT = struct.Struct('>HHHB')                      # TransID, ProtocolID, Length, UnitID
+MODBUS_READ_REQUEST_STRUCT = struct.Struct('>BHH')              # Command, Reference, WordCnt
+MODBUS_WRITE_REQUEST_STRUCT = struct.Struct('>BHHBHH')          # Command, Reference, WordCnt, ByteCnt, Data0, Data1
+MODBUS_READ_RESPONSE_STRUCT = struct.Struct('>BBHH')            # Command, ByteCnt, Data0, Data1
+MODBUS_REGISTERS_STRUCT = struct.Struct('>HH')                  # Data0, Data1
 
-class ModbusTCP(Packet):
-    name = "modbus_tcp"
-    fields_desc = [ShortField("TransID", 0),
-                   ShortField("ProtocolID", 0),
-                   ShortField("Length", 0),
-                   ByteField("UnitID", 0)
-                   ]
-
-
-class ModbusWriteRequest(Packet):
-    name = "modbus_tcp_write"
-    fields_desc = [ByteField("Command", 0),
-                   ShortField("Reference", 0),
-                   ShortField("WordCnt", 0),
-                   ByteField("ByteCnt", 0),
-                   ShortField("Data0", 0),
-                   ShortField("Data1", 0),
-                   ]
-
-
-class ModbusReadRequestOrWriteResponse(Packet):
-    name = "modbus_tcp_read_request"
-    fields_desc = [ByteField("Command", 0),
-                   ShortField("Reference", 0),
-                   ShortField("WordCnt", 0),
-                   ]
-
-
-class ModbusReadResponse(Packet):
-    name = "modbus_tcp_read_response"
-    fields_desc = [ByteField("Command", 0),
-                   ByteField("ByteCnt", 0),
-                   ShortField("Data0", 0),
-                   ShortField("Data1", 0),
-                   ]
@@ -1,4 +1,6 @@
 class NetworkNode:
+    __slots__ = ('IP', 'MAC')
+
     def __init__(self, ip, mac):
         self.IP = ip
         self.MAC = mac
